@@ -8,6 +8,7 @@ import hmac
 from aiogram import Bot
 from aiogram.types import Update
 from fastapi import Request
+from pydantic_core import from_json
 
 from app.channels.base import ChannelProtocol
 from app.channels.filters import get_non_text_reply
@@ -52,8 +53,10 @@ class TelegramChannel:
         Raises:
             ValueError: If webhook data is invalid
         """
-        body_json = await request.json()
-        update = Update(**body_json)
+        # Parse bytes with pydantic-core and keep the dict as the raw payload,
+        # instead of stdlib json + re-dumping the whole aiogram Update.
+        payload = from_json(await request.body())
+        update = Update.model_validate(payload)
 
         if not update.message:
             raise ValueError("No message in Telegram update")
@@ -90,7 +93,7 @@ class TelegramChannel:
             message_type=message_type.value,
             sender_phone=None,  # Telegram doesn't provide phone
             sender_name=sender_name,
-            raw_payload=update.model_dump(mode="json"),
+            raw_payload=payload,
         )
 
     async def send_message(self, chat_id: str, text: str) -> bool:
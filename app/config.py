@@ -26,6 +26,11 @@ class Settings(BaseSettings):
     postgres_user: str = Field(default="dancebot", description="PostgreSQL user")
     postgres_password: str = Field(..., description="PostgreSQL password (required)")
     postgres_db: str = Field(default="dancebot", description="PostgreSQL database name")
+    postgres_pool_min_size: int = Field(default=5, description="asyncpg pool: connections kept open")
+    postgres_pool_max_size: int = Field(
+        default=25,
+        description="asyncpg pool: max connections per process (api + worker share server max_connections)",
+    )
 
     # CRM Impulse configuration (CONTRACT §5)
     crm_tenant: str = Field(..., description="Impulse CRM tenant (e.g., 'studio')")
@@ -9,6 +9,10 @@ Tables cleaned:
   outbound_queue     — status='sent' rows older than 7 days
   budget_counters    — rows older than 7 days (trend analysis window)
 
+Also keeps monthly partitions of the audit logs (migration 003) created
+ahead of time via ensure_audit_partitions() (also run at startup; rows for a
+month without a partition land in the DEFAULT partition, migration 006).
+
 NOT cleaned:
   outbound_queue WHERE status='failed' (DLQ) — requires manual review (CONTRACT §9)
   outbound_queue WHERE status='cancelled'    — kept for audit
@@ -30,6 +34,11 @@ async def run_cleanup() -> None:
     """Execute all cleanup queries and log deleted row counts."""
     log = logger.bind(task="db_cleanup")
 
+    try:
+        await db.execute("SELECT ensure_audit_partitions()")
+    except Exception:
+        log.exception("cleanup.partitions_error")
+
     queries: list[tuple[str, str]] = [
         (
             "idempotency_locks",
@@ -145,9 +145,9 @@ async def get_or_create_session(
 ) -> Session:
     """Return existing valid session, or create a fresh one.
 
-    If the session is expired it is reset to IDLE before returning.
-    The new trace_id is applied after reset so it propagates through
-    the recovered session.
+    If the session is expired it is reset to IDLE before returning, with the
+    new trace_id applied in the same write so it propagates through the
+    recovered session.
     """
     session = await load_session(channel, chat_id)
 
@@ -155,10 +155,10 @@ async def get_or_create_session(
         return await create_session(trace_id, channel, chat_id)
 
     if await check_timeout(session):
-        await reset_session(session)
+        # Apply the new trace_id before the reset so both land in one upsert
         if trace_id is not None:
             session.trace_id = UUID(trace_id) if isinstance(trace_id, str) else trace_id
-            await save_session_to_store(session)
+        await reset_session(session)
 
     return session
 
@@ -463,11 +463,14 @@ class ConversationEngine:
                             sid = first_slot["schedule_id"]
                             sdate = first_slot.get("date")
                             stime = first_slot.get("time")
-                            await update_slots(session, schedule_id=str(sid), schedule_shown=True)
+                            slot_updates: dict[str, Any] = {"schedule_id": str(sid), "schedule_shown": True}
                             if sdate and stime:
                                 dt_naive = datetime.combine(sdate, stime)
-                                dt_resolved = dt_naive.replace(tzinfo=ZoneInfo("Asia/Vladivostok"))
-                                await update_slots(session, datetime_resolved=dt_resolved)
+                                slot_updates["datetime_resolved"] = dt_naive.replace(
+                                    tzinfo=ZoneInfo("Asia/Vladivostok")
+                                )
+                            # One session upsert for all slots picked from the first schedule row
+                            await update_slots(session, **slot_updates)
                         except Exception as e:
                             logger.debug("SCHEDULE_SLOT_EXTRACT_FAILED: %s", e)
                         logger.debug(
@@ -5,6 +5,7 @@ create_booking, list_bookings, cancel_booking, health_check.
 RFC-005: get_additions for schedule/addition (sticker additions).
 """
 
+import hashlib
 import json as _json
 import logging
 from functools import lru_cache
@@ -13,15 +14,37 @@ from typing import Any
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
+import httpx
+
 from app.integrations.impulse.cache import get_impulse_cache
 from app.integrations.impulse.client import get_impulse_client
 from app.integrations.impulse.error_handler import ImpulseErrorHandler
 from app.integrations.impulse.fallback import get_fallback
-from app.integrations.impulse.models import Client, Group, Reservation, Schedule
+from app.integrations.impulse.models import (
+    GROUP_LIST_ADAPTER,
+    SCHEDULE_LIST_ADAPTER,
+    Client,
+    Group,
+    Reservation,
+    Schedule,
+    parse_group_list,
+    parse_reservation_list,
+    parse_schedule_list,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _idempotency_key(*parts: object) -> str:
+    """Stable key for a CRM write, used to dedup repeated create calls.
+
+    Same inputs (incl. trace_id) → same key, so a retry of the same request
+    finds the result of a successful first attempt in crm_cache instead of writing twice.
+    """
+    raw = ":".join(str(p) for p in parts)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
 class ImpulseAdapter:
     """Impulse CRM adapter (CONTRACT §5)."""
 
@@ -32,6 +55,25 @@ class ImpulseAdapter:
         self.error_handler = ImpulseErrorHandler()
         self.fallback = get_fallback()
 
+    async def _idem_get(self, kind: str, key: str) -> dict[str, Any] | None:
+        """Look up a recorded CRM write result; a cache failure counts as a miss.
+
+        Kept outside the CRM error path so a Postgres outage is never
+        reported (and fallback-replayed) as a CRM failure.
+        """
+        try:
+            return await self.cache.get("idem", kind, key)
+        except Exception:
+            logger.warning("idempotency lookup failed kind=%s key=%s", kind, key, exc_info=True)
+            return None
+
+    async def _idem_set(self, kind: str, key: str, value: dict[str, Any]) -> None:
+        """Record a CRM write result; failures are logged, the write already happened."""
+        try:
+            await self.cache.set("idem", value, kind, key)
+        except Exception:
+            logger.warning("idempotency record failed kind=%s key=%s", kind, key, exc_info=True)
+
     async def get_schedule(
         self,
         date_from: date | None = None,
@@ -54,9 +96,9 @@ class ImpulseAdapter:
         try:
             # Cache key for full schedule (no branch filter)
             cache_key = f"{date_from}_{date_to}_{group_id}_all"
-            cached = await self.cache.get("schedule", cache_key)
+            cached = await self.cache.get_raw("schedule", cache_key)
             if cached is not None:
-                return [Schedule(**item) for item in cached]
+                return SCHEDULE_LIST_ADAPTER.validate_json(cached)
 
             # Fetch from CRM — only fields we use (avoids huge nested payloads)
             data = await self.client.list(
@@ -79,9 +121,9 @@ class ImpulseAdapter:
             # === END TEMP DEBUG ===
 
             # Parse schedules — no branch filter; consultation uses all branches
-            schedules = [Schedule(**item) for item in data]
+            schedules = parse_schedule_list(data)
 
-            await self.cache.set("schedule", [item.model_dump() for item in schedules], cache_key)
+            await self.cache.set_raw("schedule", SCHEDULE_LIST_ADAPTER.dump_json(schedules), cache_key)
             return schedules
 
         except Exception as e:
@@ -155,9 +197,9 @@ class ImpulseAdapter:
         """
         try:
             # Check cache
-            cached = await self.cache.get("groups")
+            cached = await self.cache.get_raw("groups")
             if cached is not None:
-                return [Group(**item) for item in cached]
+                return GROUP_LIST_ADAPTER.validate_json(cached)
 
             # Fetch from CRM
             data = await self.client.list(
@@ -167,8 +209,8 @@ class ImpulseAdapter:
             )
 
             # Parse and cache
-            groups = [Group(**item) for item in data]
-            await self.cache.set("groups", [item.model_dump() for item in groups])
+            groups = parse_group_list(data)
+            await self.cache.set_raw("groups", GROUP_LIST_ADAPTER.dump_json(groups))
 
             return groups
 
@@ -319,6 +361,15 @@ class ImpulseAdapter:
         elif not normalized_phone.startswith("+"):
             normalized_phone = "+" + normalized_phone
 
+        # Retry of the same request (same trace_id) → return the client from the first attempt
+        idem_key: str | None = None
+        if trace_id is not None:
+            idem_key = _idempotency_key(normalized_phone, trace_id)
+            cached = await self._idem_get("client", idem_key)
+            if cached is not None:
+                logger.info("create_client: idempotent hit key=%s", idem_key)
+                return Client(**cached)
+
         try:
             # Impulse CRM requires phone as array, deposit/bonus as non-null integers,
             # and status with pipeline to avoid getPipeline() null error on reservation creation.
@@ -335,31 +386,36 @@ class ImpulseAdapter:
             # Use tolerant method — CRM returns 500 HTML when client already exists
             response = await self.client.create_tolerant("client", data)
 
+            client = Client(id=0, name=name, phone=[normalized_phone])
+
             if response.status_code == 200:
                 result = response.json()
                 client_id = result.get("id") if isinstance(result, dict) else None
                 if client_id:
-                    return Client(id=client_id, name=name, phone=[normalized_phone])
-                return Client(**result)
+                    client = Client(id=client_id, name=name, phone=[normalized_phone])
+                else:
+                    client = Client(**result)
 
             # 500 with "already exists" message — parse client id from HTML
-            if response.status_code >= 400:
+            elif response.status_code >= 400:
                 error_text = response.text
                 match = _re.search(r"client/edit/(\d+)", error_text)
-                if match:
-                    existing_id = int(match.group(1))
-                    # Ensure existing client has a status/pipeline set (needed for reservation creation)
-                    await self.client.create_tolerant("client", {
-                        "id": existing_id,
-                        "status": {"id": 1},
-                        "deposit": 0,
-                        "bonus": 0,
-                    })
-                    return Client(id=existing_id, name=name, phone=[normalized_phone])
-                # Unexpected error — raise for fallback handling
-                response.raise_for_status()
-
-            return Client(id=0, name=name, phone=[normalized_phone])
+                if match is None:
+                    # Unexpected error — raise for fallback handling
+                    raise httpx.HTTPStatusError(
+                        f"CRM client create failed: HTTP {response.status_code}",
+                        request=response.request,
+                        response=response,
+                    )
+                existing_id = int(match.group(1))
+                # Ensure existing client has a status/pipeline set (needed for reservation creation)
+                await self.client.create_tolerant("client", {
+                    "id": existing_id,
+                    "status": {"id": 1},
+                    "deposit": 0,
+                    "bonus": 0,
+                })
+                client = Client(id=existing_id, name=name, phone=[normalized_phone])
 
         except Exception as e:
             logger.exception("Impulse CRM error: %s", e)
@@ -374,6 +430,10 @@ class ImpulseAdapter:
                 raise RuntimeError(user_msg) from e
             raise RuntimeError(user_msg) from e
 
+        if idem_key is not None and client.id:
+            await self._idem_set("client", idem_key, client.model_dump())
+        return client
+
     async def create_booking(
         self,
         client_id: int,
@@ -399,6 +459,22 @@ class ImpulseAdapter:
         Returns:
             Created reservation
         """
+        # Repeat of the same request (same trace_id) after a successful write →
+        # return the cached reservation without a second CRM write. A write whose
+        # response was lost is not cached, so it is not covered here.
+        idem_key: str | None = None
+        if trace_id is not None:
+            idem_key = _idempotency_key(
+                client_id,
+                schedule_id,
+                booking_date.date().isoformat() if booking_date else None,
+                trace_id,
+            )
+            cached = await self._idem_get("booking", idem_key)
+            if cached is not None:
+                logger.info("create_booking: idempotent hit key=%s", idem_key)
+                return Reservation(**cached)
+
         try:
             from datetime import timezone as tz
 
@@ -458,20 +534,18 @@ class ImpulseAdapter:
             )
             result = await self.client.create("reservation", data)
 
-            # Invalidate all schedule cache keys
-            await self.cache.clear_entity("schedule")
-
             # CRM returns {"success": true, "count": 1} — no reservation ID in response.
             # Construct a minimal Reservation from known data.
             reservation_id = result.get("id") if isinstance(result, dict) else None
             if not reservation_id:
-                return Reservation(
+                reservation = Reservation(
                     id=0,
                     client={"id": client_id},
                     schedule={"id": schedule_id},
                     date=booking_date.date().isoformat() if booking_date else None,
                 )
-            return Reservation(**result)
+            else:
+                reservation = Reservation(**result)
 
         except Exception as e:
             logger.exception("Impulse CRM error: %s", e)
@@ -506,6 +580,17 @@ class ImpulseAdapter:
                 raise RuntimeError(user_msg) from e
             raise RuntimeError(user_msg) from e
 
+        # The reservation exists in the CRM from here on: cache failures must not
+        # reach the fallback replay above.
+        if idem_key is not None:
+            await self._idem_set("booking", idem_key, reservation.model_dump())
+        try:
+            # Invalidate all schedule cache keys
+            await self.cache.clear_entity("schedule")
+        except Exception:
+            logger.warning("schedule cache invalidation failed after booking", exc_info=True)
+        return reservation
+
     async def list_bookings(self, client_id: int | None = None, date_from: date | None = None) -> list[Reservation]:
         """List bookings/reservations (CONTRACT §5).
 
@@ -529,7 +614,7 @@ class ImpulseAdapter:
                 page=1,
                 sort={"id": "desc"},
             )
-            reservations = [Reservation(**item) for item in data]
+            reservations = parse_reservation_list(data)
 
             # Filter client-side: skip deleted/archived
             reservations = [r for r in reservations if r.is_active]
@@ -33,6 +33,7 @@ class ImpulseCache:
     SCHEDULE_TTL = 15 * 60   # 15 minutes
     GROUPS_TTL   = 60 * 60   # 1 hour
     TEACHERS_TTL = 60 * 60   # 1 hour
+    IDEMPOTENCY_TTL = 10 * 60  # 10 minutes — same window as CONTRACT §10 locks
 
     def _get_key(self, entity: str, *args: str | int) -> str:
         """Build a cache_key string from entity + optional qualifiers.
@@ -52,6 +53,7 @@ class ImpulseCache:
             "groups":    self.GROUPS_TTL,
             "teacher":   self.TEACHERS_TTL,
             "teachers":  self.TEACHERS_TTL,
+            "idem":      self.IDEMPOTENCY_TTL,
         }
         return ttl_map.get(entity, 60 * 60)  # default 1 hour
 
@@ -106,6 +108,43 @@ class ImpulseCache:
             key, value, ttl,
         )
 
+    async def get_raw(self, entity: str, *key_parts: str | int) -> str | None:
+        """Return cached payload as JSON text, or None if missing / expired.
+
+        Skips the JSONB codec so callers can validate the text in one pass
+        (e.g. TypeAdapter.validate_json) instead of json.loads + model(**item).
+        """
+        key = self._get_key(entity, *key_parts)
+        row = await db.fetchrow(
+            """
+            SELECT payload::text AS payload FROM crm_cache
+            WHERE cache_key = $1
+              AND expires_at > NOW()
+            """,
+            key,
+        )
+        return row["payload"] if row else None
+
+    async def set_raw(self, entity: str, payload: bytes, *key_parts: str | int) -> None:
+        """Upsert an already-serialized JSON payload into crm_cache.
+
+        $2::text bypasses the JSONB codec (no second json.dumps pass);
+        Postgres parses the text into JSONB itself.
+        """
+        key = self._get_key(entity, *key_parts)
+        ttl = self._get_ttl(entity)
+        await db.execute(
+            """
+            INSERT INTO crm_cache (cache_key, payload, expires_at)
+            VALUES ($1, $2::text::jsonb, NOW() + make_interval(secs => $3))
+            ON CONFLICT (cache_key) DO UPDATE SET
+                payload    = EXCLUDED.payload,
+                expires_at = EXCLUDED.expires_at,
+                updated_at = NOW()
+            """,
+            key, payload.decode(), ttl,
+        )
+
     async def delete(self, entity: str, *key_parts: str | int) -> None:
         """Hard-delete a single cache entry by exact key."""
         key = self._get_key(entity, *key_parts)
@@ -13,11 +13,28 @@ from functools import lru_cache
 from typing import Any
 from uuid import UUID, uuid4
 
+from pydantic import BaseModel, Field
+
 from app.config import get_settings
 from app.queue.outbound import enqueue_message
 from app.storage.postgres import postgres_storage as db
 
 
+class FallbackItem(BaseModel):
+    """Payload of a crm_fallback row in outbound_queue.
+
+    Serialized with model_dump_json() in a single pass (datetime handled
+    natively, no json.dumps(default=str) callback) and stored as JSONB.
+    """
+
+    id: str = Field(..., description="Fallback item ID")
+    trace_id: str = Field(..., description="Trace ID of the failed request")
+    action: str = Field(..., description="Adapter action (create_booking, create_client, etc.)")
+    data: dict[str, Any] = Field(default_factory=dict, description="Original request data")
+    error: str = Field(..., description="Error message")
+    created_at: datetime = Field(..., description="Enqueue time (UTC)")
+
+
 class ImpulseFallback:
     """Fallback queue for CRM errors (CONTRACT §5)."""
 
@@ -46,39 +63,37 @@ class ImpulseFallback:
         if trace_id is None:
             trace_id = str(uuid4())
 
-        item_id = str(uuid4())
-        created_at = datetime.now(timezone.utc).isoformat()
-
-        payload = {
-            "id": item_id,
-            "trace_id": trace_id,
-            "action": action,
-            "data": data,
-            "error": error,
-            "created_at": created_at,
-        }
+        item = FallbackItem(
+            id=str(uuid4()),
+            trace_id=trace_id,
+            action=action,
+            data=data,
+            error=error,
+            created_at=datetime.now(timezone.utc),
+        )
 
         # text: human-readable summary for the worker / admin audit log.
         # chat_id: admin chat ID — the worker sends the retry result there.
         # trace_id column: stored as UUID for observability joins.
+        # payload: pre-serialized JSON, $3::text bypasses the pool's JSONB codec.
         text = f"[crm_fallback] action={action} error={error[:200]}"
 
         await db.execute(
             """
             INSERT INTO outbound_queue
                 (channel, chat_id, text, payload, trace_id, priority)
-            VALUES ('crm_fallback', $1, $2, $3, $4::uuid, $5)
+            VALUES ('crm_fallback', $1, $2, $3::text::jsonb, $4::uuid, $5)
             """,
             str(self.admin_chat_id),
             text,
-            payload,
+            item.model_dump_json(),
             trace_id,
             self.PRIORITY,
         )
 
-        await self._send_admin_alert(payload)
+        await self._send_admin_alert(item)
 
-    async def _send_admin_alert(self, item: dict[str, Any]) -> None:
+    async def _send_admin_alert(self, item: FallbackItem) -> None:
         """Enqueue admin alert via outbound_queue (priority=1, admin tier).
 
         Goes through the same queue and HTTP client as all other messages,
@@ -89,30 +104,30 @@ class ImpulseFallback:
         try:
             text = (
                 f"⚠️ CRM Fallback Queue\n\n"
-                f"Action: {item['action']}\n"
-                f"Error: {item['error']}\n"
-                f"Trace ID: {item['trace_id']}\n"
-                f"Created: {item['created_at']}\n\n"
-                f"Data: {json.dumps(item['data'], indent=2, ensure_ascii=False)}"
+                f"Action: {item.action}\n"
+                f"Error: {item.error}\n"
+                f"Trace ID: {item.trace_id}\n"
+                f"Created: {item.created_at.isoformat()}\n\n"
+                f"Data: {json.dumps(item.data, indent=2, ensure_ascii=False, default=str)}"
             )
             await enqueue_message(
                 chat_id=str(self.admin_chat_id),
                 channel="telegram",
                 text=text,
-                trace_id=UUID(item["trace_id"]),
+                trace_id=UUID(item.trace_id),
                 priority=1,
             )
         except Exception:
             pass
 
-    async def dequeue(self, timeout: int = 0) -> dict[str, Any] | None:
+    async def dequeue(self, timeout: int = 0) -> FallbackItem | None:
         """Dequeue next pending item from fallback queue.
 
         Args:
             timeout: Ignored (kept for API compatibility; PG is non-blocking)
 
         Returns:
-            Queue item payload or None
+            Parsed FallbackItem or None
         """
         row = await db.fetchrow(
             """
@@ -124,12 +139,12 @@ class ImpulseFallback:
                 FOR UPDATE SKIP LOCKED
                 LIMIT 1
             )
-            RETURNING payload
+            RETURNING payload::text AS payload
             """
         )
         if row is None:
             return None
-        return dict(row["payload"])
+        return FallbackItem.model_validate_json(row["payload"])
 
     async def size(self) -> int:
         """Get queue size.
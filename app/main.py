@@ -3,6 +3,9 @@
 Per CONTRACT §22: Webhook endpoints and health check.
 """
 
+import asyncio
+import traceback
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, Response, status
@@ -12,6 +15,9 @@ from app.channels.dedup import is_duplicate
 from app.channels.filters import get_non_text_reply, should_process
 from app.channels.telegram import get_telegram_channel
 from app.config import get_settings
+from app.core.engine import get_conversation_engine
+from app.integrations.impulse import get_impulse_adapter
+from app.integrations.impulse.client import get_impulse_client
 from app.queue.outbound import enqueue_message
 from app.storage.postgres import postgres_storage
 
@@ -41,7 +47,6 @@ def _wire_availability_provider(kb, impulse) -> None:
 async def _resync_teachers() -> None:
     """Periodic teacher sync for EntityResolver (RFC-004 §4.3, every 6h)."""
     from app.core.engine import get_entity_resolver
-    from app.integrations.impulse import get_impulse_adapter
     resolver = get_entity_resolver()
     if resolver is None or not getattr(resolver, "_teacher", None):
         return
@@ -78,7 +83,6 @@ async def lifespan(app: FastAPI):
         TeacherResolver,
     )
     from app.core.engine import set_entity_resolver
-    from app.integrations.impulse import get_impulse_adapter
     from app.knowledge.base import get_kb
 
     kb = get_kb()
@@ -106,10 +110,16 @@ async def lifespan(app: FastAPI):
     # ImpulseStickerProvider for RFC-005 group availability (sticker-based)
     _wire_availability_provider(kb, impulse)
 
+    # Per-request singletons, bound once after the resolver/provider wiring above
+    # so handlers read plain attributes (and the engine never sees resolver=None).
+    app.state.telegram_channel = get_telegram_channel()
+    app.state.engine = get_conversation_engine()
+
     yield
 
     # Shutdown
     scheduler.shutdown(wait=False)
+    await get_impulse_client().close()
     await postgres_storage.disconnect()
 
 
@@ -130,7 +140,7 @@ async def telegram_webhook(request: Request) -> Response:
     - Filter non-text messages
     - Process text messages
     """
-    telegram_channel = get_telegram_channel()
+    telegram_channel = request.app.state.telegram_channel
 
     # Verify signature (CONTRACT §19)
     if not telegram_channel.verify_signature(request):
@@ -145,7 +155,7 @@ async def telegram_webhook(request: Request) -> Response:
             return Response(status_code=status.HTTP_200_OK)  # Accept but don't process
 
         # Log inbound message (CONTRACT §17)
-        await postgres_storage.log_message(
+        log_inbound = postgres_storage.log_message(
             trace_id=message.trace_id,
             channel=message.channel,
             chat_id=message.chat_id,
@@ -160,6 +170,7 @@ async def telegram_webhook(request: Request) -> Response:
 
         # Filter non-text messages (CONTRACT §8)
         if not should_process(message):
+            await log_inbound
             # Enqueue friendly reply via outbound_queue (CONTRACT §9)
             reply_text = get_non_text_reply(message)
             await enqueue_message(
@@ -172,12 +183,11 @@ async def telegram_webhook(request: Request) -> Response:
 
         # Typing indicator: sent directly — it's a real-time signal that
         # would be stale by the time the worker processes it from the queue.
-        await telegram_channel.send_typing(message.chat_id)
+        # Independent of the inbound log, so both go out at once.
+        await asyncio.gather(log_inbound, telegram_channel.send_typing(message.chat_id))
 
         # Process message through conversation engine (RFC-003)
-        from app.core.engine import get_conversation_engine
-
-        engine = get_conversation_engine()
+        engine = request.app.state.engine
         response_text = await engine.handle_message(message, message.trace_id)
 
         # Enqueue response via outbound_queue (CONTRACT §9)
@@ -207,8 +217,6 @@ async def telegram_webhook(request: Request) -> Response:
         return Response(status_code=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         # Log error to Postgres (CONTRACT §17)
-        import traceback
-
         await postgres_storage.log_error(
             error_type=type(e).__name__,
             error_message=str(e),
@@ -217,28 +225,25 @@ async def telegram_webhook(request: Request) -> Response:
         return Response(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+async def _probe(check: Callable[[], Awaitable[bool]]) -> bool:
+    """Run a health probe; any exception (incl. building the client) counts as unhealthy."""
+    try:
+        return bool(await check())
+    except Exception:
+        return False
+
+
 @app.get("/health")
 async def health_check() -> JSONResponse:
     """Health check endpoint (CONTRACT §22).
 
     Returns: {status, postgres, crm, pool_stats}
     """
-    # Check Postgres
-    postgres_healthy = False
-    try:
-        postgres_healthy = await postgres_storage.health_check()
-    except Exception:
-        pass
-
-    # Check CRM
-    crm_healthy = False
-    try:
-        from app.integrations.impulse import get_impulse_adapter
-
-        impulse = get_impulse_adapter()
-        crm_healthy = await impulse.health_check()
-    except Exception:
-        pass
+    # Probe Postgres and CRM concurrently: latency is max() of the two, not the sum
+    postgres_healthy, crm_healthy = await asyncio.gather(
+        _probe(postgres_storage.health_check),
+        _probe(lambda: get_impulse_adapter().health_check()),
+    )
 
     pool = {}
     try:
@@ -279,16 +284,14 @@ async def debug_command(request: Request) -> JSONResponse:
             content={"error": "Not found"},
         )
 
-    telegram_channel = get_telegram_channel()
+    telegram_channel = request.app.state.telegram_channel
 
     try:
         # Parse webhook
         message = await telegram_channel.parse_webhook(request)
 
         # Process through conversation engine (RFC-003)
-        from app.core.engine import get_conversation_engine
-
-        engine = get_conversation_engine()
+        engine = request.app.state.engine
         response_text = await engine.handle_message(message, message.trace_id)
 
         return JSONResponse(
@@ -300,8 +303,6 @@ async def debug_command(request: Request) -> JSONResponse:
         )
 
     except Exception as e:
-        import traceback
-
         await postgres_storage.log_error(
             error_type=type(e).__name__,
             error_message=str(e),
@@ -10,6 +10,14 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, field_validator
 
+_UTC = timezone.utc
+_now = datetime.now
+
+
+def _utcnow() -> datetime:
+    """Current UTC time; module-level so session defaults skip global lookups."""
+    return _now(_UTC)
+
 
 class MessageType(str, Enum):
     """Message type enumeration."""
@@ -156,18 +164,18 @@ class Session(BaseModel):
         description="Slot values for booking flow",
     )
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utcnow,
         description="Session creation time",
     )
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utcnow,
         description="Last update time",
     )
     expires_at: datetime = Field(..., description="Session expiration time (TTL 24h)")
 
     def update(self) -> None:
         """Update the updated_at timestamp."""
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _utcnow()
 
 
 class BookingRequest(BaseModel):
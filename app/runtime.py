@@ -0,0 +1,22 @@
+"""Event loop entry point for standalone processes (outbound worker, regression runner)."""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run main() like asyncio.run(), on uvloop when it is installed.
+
+    uvloop comes with uvicorn[standard] on Linux; elsewhere the default loop is used.
+    """
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
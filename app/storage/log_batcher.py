@@ -0,0 +1,134 @@
+"""In-process batching for append-only audit INSERTs.
+
+Separated from postgres.py to keep that module under 300 lines.
+Handlers enqueue a row tuple and return immediately; one background task
+coalesces rows (up to max_batch, or max_delay seconds after the first one)
+and writes them on one pooled connection with a single executemany().
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Queued by close(): the flusher writes what it has and exits
+_STOP: Any = object()
+
+
+class LogBatcher:
+    """Queue + flusher task for one INSERT statement."""
+
+    def __init__(
+        self,
+        name: str,
+        sql: str,
+        max_batch: int = 200,
+        max_delay: float = 0.05,
+    ) -> None:
+        """Initialize batcher.
+
+        Args:
+            name: Table name (log messages)
+            sql: Parameterized INSERT executed once per row via executemany
+            max_batch: Flush as soon as this many rows are pending
+            max_delay: Flush at most this many seconds after the first pending row
+        """
+        self.name = name
+        self.sql = sql
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._pool: asyncpg.Pool | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, pool: asyncpg.Pool) -> None:
+        """Start the flusher task on the running event loop."""
+        self._pool = pool
+        self._task = asyncio.create_task(self._run(), name=f"log_batcher:{self.name}")
+
+    def put(self, row: tuple[Any, ...]) -> None:
+        """Enqueue one row; never blocks."""
+        self._queue.put_nowait(row)
+
+    async def close(self) -> None:
+        """Flush everything queued so far and stop the flusher task."""
+        if self._task is not None:
+            self._queue.put_nowait(_STOP)
+            await self._task
+            self._task = None
+        # Rows queued behind the stop marker
+        batch = [row for row in self._drain() if row is not _STOP]
+        if batch:
+            await self._flush(batch)
+
+    def _drain(self) -> list[Any]:
+        items = []
+        while not self._queue.empty():
+            items.append(self._queue.get_nowait())
+        return items
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            row = await self._queue.get()
+            if row is _STOP:
+                return
+            batch = [row]
+            stop = False
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    row = self._queue.get_nowait()
+                else:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        row = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if row is _STOP:
+                    stop = True
+                    break
+                batch.append(row)
+            await self._flush(batch)
+            if stop:
+                return
+
+    async def _flush(self, batch: list[tuple[Any, ...]]) -> None:
+        """Write one batch. Errors are logged, never raised (audit logs are best-effort).
+
+        A batch write is all-or-nothing, so when it fails the rows are retried
+        one at a time: one bad row loses only itself, not its batch neighbours.
+        """
+        if self._pool is None:
+            return
+        try:
+            async with self._pool.acquire() as conn:
+                try:
+                    await conn.executemany(self.sql, batch)
+                except Exception:
+                    logger.warning(
+                        "batch write of %d %s rows failed, retrying row by row",
+                        len(batch), self.name, exc_info=True,
+                    )
+                    await self._write_rows(conn, batch)
+        except Exception:
+            logger.exception("failed to flush %d %s rows", len(batch), self.name)
+
+    async def _write_rows(self, conn: asyncpg.Connection, batch: list[tuple[Any, ...]]) -> None:
+        for i, row in enumerate(batch):
+            if conn.is_closed():
+                logger.error("connection lost, dropping %d %s rows", len(batch) - i, self.name)
+                return
+            try:
+                await conn.execute(self.sql, *row)
+            except Exception:
+                logger.exception("failed to write %s row", self.name)
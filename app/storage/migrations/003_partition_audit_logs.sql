@@ -0,0 +1,96 @@
+-- =============================================================================
+-- Migration 003: Monthly RANGE partitions for append-only audit logs
+--
+-- tool_calls, llm_calls, errors, dead_letter_messages are insert-only and grow
+-- without bound. Partitioning by created_at keeps the hot indexes small and
+-- turns retention into DROP TABLE <partition> (no bulk DELETE, no VACUUM).
+--
+-- messages is NOT partitioned: a unique index on a partitioned table must
+-- include the partition key, so UNIQUE (channel, message_id) — the target of
+-- log_message's ON CONFLICT — cannot exist there.
+--
+-- Partitions are named <table>_YYYY_MM with UTC month bounds. This migration
+-- creates them from the oldest existing row up to two months ahead;
+-- app/core/cleanup.py calls ensure_audit_partitions() every run to stay ahead.
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+    parent       TEXT,
+    since        TIMESTAMP WITH TIME ZONE,
+    months_ahead INTEGER
+) RETURNS VOID LANGUAGE plpgsql AS $$
+DECLARE
+    month_start TIMESTAMP := date_trunc('month', since AT TIME ZONE 'UTC');
+    last_month  TIMESTAMP := date_trunc('month', NOW() AT TIME ZONE 'UTC')
+                             + make_interval(months => months_ahead);
+BEGIN
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(month_start, 'YYYY_MM'),
+            parent,
+            month_start AT TIME ZONE 'UTC',
+            (month_start + INTERVAL '1 month') AT TIME ZONE 'UTC'
+        );
+        month_start := month_start + INTERVAL '1 month';
+    END LOOP;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION ensure_audit_partitions(months_ahead INTEGER DEFAULT 2)
+RETURNS VOID LANGUAGE plpgsql AS $$
+DECLARE
+    tbl TEXT;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['tool_calls', 'llm_calls', 'errors', 'dead_letter_messages'] LOOP
+        PERFORM ensure_monthly_partitions(tbl, NOW(), months_ahead);
+    END LOOP;
+END;
+$$;
+
+-- Swap a plain table for a partitioned copy with the same columns, defaults
+-- (including the existing id sequence) and rows. Indexes are recreated below.
+CREATE OR REPLACE FUNCTION _partition_by_created_at(tbl TEXT) RETURNS VOID LANGUAGE plpgsql AS $$
+DECLARE
+    old_tbl TEXT := tbl || '_old';
+    oldest  TIMESTAMP WITH TIME ZONE;
+BEGIN
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', tbl, old_tbl);
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        'PARTITION BY RANGE (created_at)',
+        tbl, old_tbl
+    );
+    -- Keep the BIGSERIAL sequence alive when the old table is dropped
+    EXECUTE format('ALTER SEQUENCE %I OWNED BY %I.id', tbl || '_id_seq', tbl);
+
+    EXECUTE format('SELECT min(created_at) FROM %I', old_tbl) INTO oldest;
+    PERFORM ensure_monthly_partitions(tbl, COALESCE(oldest, NOW()), 2);
+
+    EXECUTE format('INSERT INTO %I SELECT * FROM %I', tbl, old_tbl);
+    EXECUTE format('DROP TABLE %I', old_tbl);
+    -- Partition key must be part of the primary key
+    EXECUTE format('ALTER TABLE %I ADD PRIMARY KEY (id, created_at)', tbl);
+END;
+$$;
+
+SELECT _partition_by_created_at('tool_calls');
+SELECT _partition_by_created_at('llm_calls');
+SELECT _partition_by_created_at('errors');
+SELECT _partition_by_created_at('dead_letter_messages');
+
+DROP FUNCTION _partition_by_created_at(TEXT);
+
+-- Lookup indexes from migration 000, now created per partition; the created_at
+-- indexes are BRIN (migration 004)
+CREATE INDEX IF NOT EXISTS idx_tool_calls_trace_id   ON tool_calls (trace_id);
+CREATE INDEX IF NOT EXISTS idx_tool_calls_tool_name  ON tool_calls (tool_name);
+
+CREATE INDEX IF NOT EXISTS idx_llm_calls_trace_id   ON llm_calls (trace_id);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_provider   ON llm_calls (provider);
+
+CREATE INDEX IF NOT EXISTS idx_errors_trace_id   ON errors (trace_id);
+CREATE INDEX IF NOT EXISTS idx_errors_error_type ON errors (error_type);
+
+CREATE INDEX IF NOT EXISTS idx_dlq_trace_id   ON dead_letter_messages (trace_id);
+CREATE INDEX IF NOT EXISTS idx_dlq_channel    ON dead_letter_messages (channel);
@@ -0,0 +1,28 @@
+-- =============================================================================
+-- Migration 004: BRIN instead of B-tree for time columns of audit logs
+--
+-- Audit rows are inserted in time order, so a BRIN index (min/max per block
+-- range) answers created_at range scans with an index a few pages in size,
+-- while each B-tree on these columns grew with every INSERT.
+-- On the partitioned tables (migration 003) the index is created per partition.
+-- =============================================================================
+
+DROP INDEX IF EXISTS idx_tool_calls_created_at;
+CREATE INDEX IF NOT EXISTS idx_tool_calls_created_at_brin
+    ON tool_calls USING BRIN (created_at) WITH (pages_per_range = 32);
+
+DROP INDEX IF EXISTS idx_llm_calls_created_at;
+CREATE INDEX IF NOT EXISTS idx_llm_calls_created_at_brin
+    ON llm_calls USING BRIN (created_at) WITH (pages_per_range = 32);
+
+DROP INDEX IF EXISTS idx_errors_created_at;
+CREATE INDEX IF NOT EXISTS idx_errors_created_at_brin
+    ON errors USING BRIN (created_at) WITH (pages_per_range = 32);
+
+DROP INDEX IF EXISTS idx_dlq_created_at;
+CREATE INDEX IF NOT EXISTS idx_dlq_created_at_brin
+    ON dead_letter_messages USING BRIN (created_at) WITH (pages_per_range = 32);
+
+DROP INDEX IF EXISTS idx_messages_timestamp;
+CREATE INDEX IF NOT EXISTS idx_messages_timestamp_brin
+    ON messages USING BRIN (timestamp) WITH (pages_per_range = 32);
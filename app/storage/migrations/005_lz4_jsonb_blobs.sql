@@ -0,0 +1,25 @@
+-- =============================================================================
+-- Migration 005: LZ4 TOAST compression for large audit JSONB columns
+--
+-- llm_calls.request_json carries the full prompt (system prompt + KB context +
+-- tool schemas), so each row is many KB. Postgres already compresses such
+-- values in TOAST with pglz; LZ4 compresses several times faster at a similar
+-- ratio, which is what matters on this write-only path. Existing rows keep
+-- their pglz encoding; only new values use LZ4. Partitions created with
+-- PARTITION OF inherit the setting from the parent; the LIKE-based ones from
+-- migration 006 copy it with INCLUDING COMPRESSION.
+--
+-- Skipped with a NOTICE on servers built without LZ4 support.
+-- =============================================================================
+
+DO $$
+BEGIN
+    ALTER TABLE llm_calls
+        ALTER COLUMN request_json  SET COMPRESSION lz4,
+        ALTER COLUMN response_json SET COMPRESSION lz4;
+    ALTER TABLE booking_attempts
+        ALTER COLUMN crm_response SET COMPRESSION lz4;
+EXCEPTION WHEN feature_not_supported THEN
+    RAISE NOTICE 'lz4 TOAST compression unavailable, keeping pglz: %', SQLERRM;
+END;
+$$;
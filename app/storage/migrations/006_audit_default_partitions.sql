@@ -0,0 +1,81 @@
+-- =============================================================================
+-- Migration 006: DEFAULT partitions for the partitioned audit logs
+--
+-- Without a DEFAULT partition an INSERT whose created_at has no monthly
+-- partition yet (fresh deploy before the first cleanup run, cleanup job down,
+-- clock skew) fails and the audit row is lost. Such rows now land in
+-- <table>_default.
+--
+-- ensure_monthly_partitions() is redefined so it can still add a month once
+-- rows for it sit in the DEFAULT partition: the partition is created detached,
+-- those rows are moved into it, then it is attached. The DEFAULT partition is
+-- locked meanwhile so no new row for that month can slip in between.
+-- The detached partition is created with LIKE ... INCLUDING COMPRESSION so it
+-- keeps the parent's per-column TOAST compression (lz4 from migration 005);
+-- the partitions that already exist are set to lz4 explicitly at the end.
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+    parent       TEXT,
+    since        TIMESTAMP WITH TIME ZONE,
+    months_ahead INTEGER
+) RETURNS VOID LANGUAGE plpgsql AS $$
+DECLARE
+    month_start  TIMESTAMP := date_trunc('month', since AT TIME ZONE 'UTC');
+    last_month   TIMESTAMP := date_trunc('month', NOW() AT TIME ZONE 'UTC')
+                              + make_interval(months => months_ahead);
+    default_part TEXT := parent || '_default';
+    part         TEXT;
+    range_from   TIMESTAMP WITH TIME ZONE;
+    range_to     TIMESTAMP WITH TIME ZONE;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        part := parent || '_' || to_char(month_start, 'YYYY_MM');
+        range_from := month_start AT TIME ZONE 'UTC';
+        range_to := (month_start + INTERVAL '1 month') AT TIME ZONE 'UTC';
+        IF to_regclass(part) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS '
+                'INCLUDING COMPRESSION)',
+                part, parent
+            );
+            IF to_regclass(default_part) IS NOT NULL THEN
+                EXECUTE format('LOCK TABLE %I IN ACCESS EXCLUSIVE MODE', default_part);
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM %I WHERE created_at >= %L AND created_at < %L '
+                    'RETURNING *) INSERT INTO %I SELECT * FROM moved',
+                    default_part, range_from, range_to, part
+                );
+            END IF;
+            EXECUTE format(
+                'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                parent, part, range_from, range_to
+            );
+        END IF;
+        month_start := month_start + INTERVAL '1 month';
+    END LOOP;
+END;
+$$;
+
+CREATE TABLE IF NOT EXISTS tool_calls_default           PARTITION OF tool_calls DEFAULT;
+CREATE TABLE IF NOT EXISTS llm_calls_default            PARTITION OF llm_calls DEFAULT;
+CREATE TABLE IF NOT EXISTS errors_default               PARTITION OF errors DEFAULT;
+CREATE TABLE IF NOT EXISTS dead_letter_messages_default PARTITION OF dead_letter_messages DEFAULT;
+
+-- Existing llm_calls partitions (migration 003 months + the DEFAULT above)
+DO $$
+DECLARE
+    part REGCLASS;
+BEGIN
+    FOR part IN SELECT inhrelid::regclass FROM pg_inherits
+                WHERE inhparent = 'llm_calls'::regclass LOOP
+        EXECUTE format(
+            'ALTER TABLE %s ALTER COLUMN request_json SET COMPRESSION lz4, '
+            'ALTER COLUMN response_json SET COMPRESSION lz4',
+            part
+        );
+    END LOOP;
+EXCEPTION WHEN feature_not_supported THEN
+    RAISE NOTICE 'lz4 TOAST compression unavailable, keeping pglz: %', SQLERRM;
+END;
+$$;
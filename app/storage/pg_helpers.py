@@ -62,6 +62,19 @@ async def run_migrations(pool: asyncpg.Pool) -> None:
             logger.info("pg_migrations: applied %s", path.name)
 
 
+async def ensure_partitions(pool: asyncpg.Pool) -> None:
+    """Create the current and upcoming monthly audit-log partitions (migration 003).
+
+    Run on every startup (app and worker) in addition to the hourly cleanup,
+    so a fresh deploy never writes a month without its partition. Failures are
+    logged only: such rows fall into the DEFAULT partition (migration 006).
+    """
+    try:
+        await pool.execute("SELECT ensure_audit_partitions()")
+    except Exception:
+        logger.exception("pg_migrations: ensure_audit_partitions failed")
+
+
 def pool_stats(pool: asyncpg.Pool) -> dict:
     """Return connection pool metrics for the /health endpoint.
 
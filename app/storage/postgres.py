@@ -7,18 +7,74 @@ Per RFC-002 §5.1: Migrations run automatically on startup before serving traffi
 
 import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 import asyncpg
 from asyncpg import Pool
+from pydantic_core import to_json
 
 from app.config import get_settings
-from app.storage.pg_helpers import pool_stats, run_migrations
+from app.storage.log_batcher import LogBatcher
+from app.storage.pg_helpers import ensure_partitions, pool_stats, run_migrations
 
 logger = logging.getLogger(__name__)
 
+_STATEMENT_CACHE_SIZE = 256
+
+_INSERT_MESSAGE = """
+    INSERT INTO messages (
+        trace_id, channel, chat_id, message_id, timestamp, text,
+        message_type, sender_phone, sender_name, direction
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+    ON CONFLICT (channel, message_id) DO NOTHING
+"""
+
+# JSONB values arrive pre-encoded (see _log_batched), hence ::text::jsonb
+_INSERT_TOOL_CALL = """
+    INSERT INTO tool_calls (
+        trace_id, tool_name, parameters, result, error, duration_ms
+    ) VALUES ($1, $2, $3::text::jsonb, $4::text::jsonb, $5, $6)
+"""
+
+_INSERT_LLM_CALL = """
+    INSERT INTO llm_calls (
+        trace_id, provider, model, prompt_tokens, completion_tokens,
+        total_tokens, cost_usd, request_json, response_json,
+        error, duration_ms
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8::text::jsonb, $9::text::jsonb, $10, $11)
+"""
+
+_INSERT_BOOKING_ATTEMPT = """
+    INSERT INTO booking_attempts (
+        trace_id, channel, chat_id, group_id, schedule_id, datetime,
+        client_name, client_phone, success, error_message, crm_response
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+"""
+
+_INSERT_ERROR = """
+    INSERT INTO errors (
+        trace_id, error_type, error_message, stack_trace, context
+    ) VALUES ($1, $2, $3, $4, $5)
+"""
+
+_INSERT_DEAD_LETTER = """
+    INSERT INTO dead_letter_messages (
+        trace_id, channel, chat_id, text, error, attempts
+    ) VALUES ($1, $2, $3, $4, $5, $6)
+"""
+
+
+def _encode_jsonb(value: Any) -> str:
+    """JSONB parameter encoder: pydantic-core serializer, ~2x faster than json.dumps.
+
+    Compact UTF-8 output (no ensure_ascii escaping of Cyrillic text).
+    """
+    return to_json(value).decode()
+
 
 async def _init_connection(conn: asyncpg.Connection) -> None:
     """Register JSONB codec so asyncpg serializes/deserializes dicts automatically.
@@ -29,7 +85,8 @@ async def _init_connection(conn: asyncpg.Connection) -> None:
     """
     await conn.set_type_codec(
         "jsonb",
-        encoder=json.dumps,
+        encoder=_encode_jsonb,
+        # Decoding stays on stdlib json: from_json measured no faster for these payloads
         decoder=json.loads,
         schema="pg_catalog",
     )
@@ -40,13 +97,19 @@ class PostgresStorage:
 
     def __init__(self) -> None:
         self._pool: Pool | None = None
+        # High-volume audit rows are coalesced per table and written with one executemany
+        self._batchers: dict[str, LogBatcher] = {
+            "messages": LogBatcher("messages", _INSERT_MESSAGE),
+            "tool_calls": LogBatcher("tool_calls", _INSERT_TOOL_CALL),
+            "llm_calls": LogBatcher("llm_calls", _INSERT_LLM_CALL),
+        }
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     async def connect(self) -> None:
-        """Create pool (min=2, max=10), register JSONB codec, run migrations.
+        """Create pool (size from settings), register JSONB codec, run migrations.
 
         Called once from FastAPI lifespan on startup. All DDL (including audit
         tables) is applied by run_migrations() from the migrations/ directory.
@@ -55,16 +118,31 @@ class PostgresStorage:
         settings = get_settings()
         self._pool = await asyncpg.create_pool(
             settings.postgres_url,
-            min_size=2,
-            max_size=10,
+            min_size=settings.postgres_pool_min_size,
+            max_size=settings.postgres_pool_max_size,
+            # Idle connections above min_size are closed after 5 min
+            max_inactive_connection_lifetime=300,
             init=_init_connection,
+            # asyncpg prepares every parameterized query once per connection and
+            # reuses it by SQL text; ~50 distinct statements in the app, so keep
+            # headroom over the default LRU size of 100 to avoid re-parsing.
+            statement_cache_size=_STATEMENT_CACHE_SIZE,
+        )
+        logger.info(
+            "postgres: pool created (min=%d, max=%d)",
+            settings.postgres_pool_min_size,
+            settings.postgres_pool_max_size,
         )
-        logger.info("postgres: pool created (min=2, max=10)")
         await run_migrations(self._pool)
+        await ensure_partitions(self._pool)
+        for batcher in self._batchers.values():
+            batcher.start(self._pool)
         logger.info("postgres: ready")
 
     async def disconnect(self) -> None:
-        """Gracefully close pool on shutdown."""
+        """Flush batched log rows, then gracefully close pool on shutdown."""
+        for batcher in self._batchers.values():
+            await batcher.close()
         if self._pool:
             await self._pool.close()
             self._pool = None
@@ -99,6 +177,16 @@ class PostgresStorage:
         async with self.pool.acquire() as conn:
             return await conn.fetchval(query, *args, column=column)
 
+    @asynccontextmanager
+    async def worker_connection(self) -> AsyncIterator[asyncpg.Connection]:
+        """Pin one pooled connection for a run of back-to-back statements.
+
+        Used by the outbound worker to claim its batch. Release it before any
+        network call to another service (Telegram, CRM).
+        """
+        async with self.pool.acquire() as conn:
+            yield conn
+
     # ------------------------------------------------------------------
     # Observability
     # ------------------------------------------------------------------
@@ -119,11 +207,38 @@ class PostgresStorage:
         """
         return pool_stats(self.pool)
 
+    async def _log_batched(
+        self,
+        table: str,
+        sql: str,
+        row: tuple[Any, ...],
+        jsonb: tuple[int, ...] = (),
+    ) -> None:
+        """Queue an audit row for the table's batcher; write directly if not running.
+
+        Values at the jsonb positions are encoded to JSON text right away, so the
+        row records them as they were at call time even if the caller later
+        mutates them (e.g. the engine appending to a logged messages list).
+        Raises only on the direct path — callers log and swallow.
+        """
+        if jsonb:
+            values = list(row)
+            for i in jsonb:
+                if values[i] is not None:
+                    values[i] = _encode_jsonb(values[i])
+            row = tuple(values)
+        batcher = self._batchers[table]
+        if batcher.running:
+            batcher.put(row)
+        else:
+            await self.execute(sql, *row)
+
     # ------------------------------------------------------------------
     # Audit logging (CONTRACT §17)
     # All methods are fire-and-forget: exceptions are logged but never
     # re-raised so a logging failure cannot crash the request handler.
-    # JSONB columns receive raw dicts — the pool codec serializes them.
+    # JSONB columns receive raw dicts — the pool codec serializes them
+    # (batched tables encode them when queued, see _log_batched).
     # ------------------------------------------------------------------
 
     async def log_message(
@@ -139,19 +254,16 @@ class PostgresStorage:
         sender_phone: str | None = None,
         sender_name: str | None = None,
     ) -> None:
-        """Log inbound or outbound message (CONTRACT §17)."""
+        """Log inbound or outbound message (CONTRACT §17).
+
+        Returns immediately once the pool is connected: the row is queued and
+        written in a batch by the table's LogBatcher.
+        """
         try:
-            await self.execute(
-                """
-                INSERT INTO messages (
-                    trace_id, channel, chat_id, message_id, timestamp, text,
-                    message_type, sender_phone, sender_name, direction
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                ON CONFLICT (channel, message_id) DO NOTHING
-                """,
+            await self._log_batched("messages", _INSERT_MESSAGE, (
                 trace_id, channel, chat_id, message_id, timestamp, text,
                 message_type, sender_phone, sender_name, direction,
-            )
+            ))
         except Exception:
             logger.exception("failed to log message trace_id=%s", trace_id)
 
@@ -172,12 +284,7 @@ class PostgresStorage:
         """Log CRM booking attempt (CONTRACT §17)."""
         try:
             await self.execute(
-                """
-                INSERT INTO booking_attempts (
-                    trace_id, channel, chat_id, group_id, schedule_id, datetime,
-                    client_name, client_phone, success, error_message, crm_response
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-                """,
+                _INSERT_BOOKING_ATTEMPT,
                 trace_id, channel, chat_id, group_id, schedule_id, datetime_,
                 client_name, client_phone, success, error_message, crm_response,
             )
@@ -193,16 +300,11 @@ class PostgresStorage:
         error: str | None = None,
         duration_ms: int | None = None,
     ) -> None:
-        """Log LLM tool call (CONTRACT §17)."""
+        """Log LLM tool call (CONTRACT §17). Batched like log_message."""
         try:
-            await self.execute(
-                """
-                INSERT INTO tool_calls (
-                    trace_id, tool_name, parameters, result, error, duration_ms
-                ) VALUES ($1, $2, $3, $4, $5, $6)
-                """,
+            await self._log_batched("tool_calls", _INSERT_TOOL_CALL, (
                 trace_id, tool_name, parameters, result, error, duration_ms,
-            )
+            ), jsonb=(2, 3))
         except Exception:
             logger.exception("failed to log tool_call trace_id=%s", trace_id)
 
@@ -220,20 +322,13 @@ class PostgresStorage:
         error: str | None = None,
         duration_ms: int | None = None,
     ) -> None:
-        """Log LLM API call with token/cost metrics (CONTRACT §17)."""
+        """Log LLM API call with token/cost metrics (CONTRACT §17). Batched like log_message."""
         try:
-            await self.execute(
-                """
-                INSERT INTO llm_calls (
-                    trace_id, provider, model, prompt_tokens, completion_tokens,
-                    total_tokens, cost_usd, request_json, response_json,
-                    error, duration_ms
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-                """,
+            await self._log_batched("llm_calls", _INSERT_LLM_CALL, (
                 trace_id, provider, model, prompt_tokens, completion_tokens,
                 total_tokens, cost_usd, request_json, response_json,
                 error, duration_ms,
-            )
+            ), jsonb=(7, 8))
         except Exception:
             logger.exception("failed to log llm_call trace_id=%s", trace_id)
 
@@ -248,11 +343,7 @@ class PostgresStorage:
         """Log application error (CONTRACT §17)."""
         try:
             await self.execute(
-                """
-                INSERT INTO errors (
-                    trace_id, error_type, error_message, stack_trace, context
-                ) VALUES ($1, $2, $3, $4, $5)
-                """,
+                _INSERT_ERROR,
                 trace_id, error_type, error_message, stack_trace, context,
             )
         except Exception:
@@ -270,11 +361,7 @@ class PostgresStorage:
         """Log undeliverable outbound message to DLQ (CONTRACT §17, §9)."""
         try:
             await self.execute(
-                """
-                INSERT INTO dead_letter_messages (
-                    trace_id, channel, chat_id, text, error, attempts
-                ) VALUES ($1, $2, $3, $4, $5, $6)
-                """,
+                _INSERT_DEAD_LETTER,
                 trace_id, channel, chat_id, text, error, attempts,
             )
         except Exception:
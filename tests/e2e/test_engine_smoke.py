@@ -103,7 +103,7 @@ async def _fake_execute(query: str, *args):
             # Update slots and state in place
             from app.models import ConversationState, SlotValues
             existing.state = ConversationState(args[2])
-            existing.slots = SlotValues.model_validate(args[3])
+            existing.slots = SlotValues.model_validate_json(args[3])
             existing.updated_at = args[8]
         else:
             from app.models import ConversationState, Session, SlotValues
@@ -119,7 +119,7 @@ async def _fake_execute(query: str, *args):
                 channel=channel,
                 chat_id=chat_id,
                 state=ConversationState(args[2]),
-                slots=SlotValues.model_validate(args[3]),
+                slots=SlotValues.model_validate_json(args[3]),
                 created_at=args[7],
                 updated_at=args[8],
                 expires_at=args[6],
@@ -17,6 +17,7 @@ RFC-003 additions:
 import asyncio
 import os
 import sys
+from collections import deque
 from pathlib import Path
 
 # Override budget limits for regression so they don't create noise during test run
@@ -27,14 +28,33 @@ from uuid import uuid4
 
 import yaml
 
+# Suite files live next to this module
+_TEST_DIR = Path(__file__).parent
+
 # Add project root to path
-project_root = Path(__file__).parent.parent.parent
+project_root = _TEST_DIR.parent.parent
 sys.path.insert(0, str(project_root))
 
 from datetime import datetime, timezone
 
 from app.core.engine import get_conversation_engine
 from app.models import UnifiedMessage
+from app.runtime import run
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Suites running at the same time (each makes its own LLM calls)
+_SUITE_CONCURRENCY = 4
+
+
+def _run_chat_id(suite: str, run: int) -> str:
+    """Chat ID for the run-th stability run of a suite.
+
+    Each suite and each run keeps its own session across the suite's tests,
+    so suites and runs can execute concurrently without sharing conversation state.
+    """
+    return f"test_chat_{suite}_{run}"
 
 
 class TestRunner:
@@ -45,7 +65,7 @@ class TestRunner:
         self.runs_per_test = 1  # 1 run for speed; increase to 3 for stability checks
         self.suite_threshold = 0.90  # ≥ 90% must pass
 
-    async def _apply_setup(self, setup: dict[str, Any]) -> None:
+    async def _apply_setup(self, setup: dict[str, Any], chat_id: str) -> None:
         """Pre-fill session slots and apply CRM mocks before a test case.
 
         setup.slots keys map directly to SlotValues fields.
@@ -55,11 +75,11 @@ class TestRunner:
         from app.storage.session_store import delete_session
 
         # Reset session so setup starts clean
-        await delete_session("telegram", "test_chat")
+        await delete_session("telegram", chat_id)
 
         slots = setup.get("slots", {})
         if slots:
-            session = await get_or_create_session(str(uuid4()), "telegram", "test_chat")
+            session = await get_or_create_session(str(uuid4()), "telegram", chat_id)
             await update_slots(session, **slots)
 
         # crm_mock stored as marker on engine for future use (no-op for now)
@@ -73,7 +93,8 @@ class TestRunner:
     async def run_test_case(
         self,
         test_case: dict[str, Any],
-        conversation_history: list[dict[str, str]],
+        conversation_history: deque[dict[str, str]],
+        chat_id: str = "test_chat",
     ) -> tuple[bool, str, str]:
         """Run a single test case.
 
@@ -83,7 +104,7 @@ class TestRunner:
         # Apply setup if present (resets session + pre-fills slots)
         setup = test_case.get("setup", {})
         if setup:
-            await self._apply_setup(setup)
+            await self._apply_setup(setup, chat_id)
 
         user_input = test_case.get("user", "")
         expected = test_case.get("expected", {})
@@ -94,7 +115,7 @@ class TestRunner:
 
         message = UnifiedMessage(
             channel="telegram",
-            chat_id="test_chat",
+            chat_id=chat_id,
             message_id=str(uuid4()),
             timestamp=datetime.now(timezone.utc),
             text=user_input,
@@ -108,23 +129,24 @@ class TestRunner:
 
         passed = True
         errors = []
+        response_lower = response_text.lower()
 
         # contains — ALL must be present
         for phrase in expected.get("contains", []):
-            if phrase.lower() not in response_text.lower():
+            if phrase.lower() not in response_lower:
                 passed = False
                 errors.append(f"Missing: '{phrase}'")
 
         # not_contains — NONE must be present
         for phrase in expected.get("not_contains", []):
-            if phrase.lower() in response_text.lower():
+            if phrase.lower() in response_lower:
                 passed = False
                 errors.append(f"Unexpected: '{phrase}'")
 
         # contains_one_of — AT LEAST ONE must be present
         one_of = expected.get("contains_one_of", [])
         if one_of:
-            if not any(phrase.lower() in response_text.lower() for phrase in one_of):
+            if not any(phrase.lower() in response_lower for phrase in one_of):
                 passed = False
                 errors.append(f"None of {one_of} found in response")
 
@@ -143,18 +165,23 @@ class TestRunner:
         return passed, response_text, error_msg
 
     async def run_test_suite(self, test_file: Path) -> dict[str, Any]:
-        """Run a test suite from YAML file."""
+        """Run a test suite from YAML file.
+
+        Progress lines are collected in results["report"] rather than printed,
+        so concurrently running suites do not interleave their output.
+        """
         with open(test_file, "r", encoding="utf-8") as f:
-            suite_data = yaml.safe_load(f)
+            suite_data = yaml.load(f, Loader=_LOADER)
 
         suite_name = suite_data.get("name", test_file.stem)
         all_tests = suite_data.get("tests", [])
+        report: list[str] = []
 
         # Skipped tests are excluded from totals so they don't drag down pass rate
         for t in all_tests:
             if t.get("skip"):
                 reason = t.get("skip_reason", "requires mock wiring")
-                print(f"  SKIP: {t.get('name', 'unnamed')} ({reason})")
+                report.append(f"  SKIP: {t.get('name', 'unnamed')} ({reason})")
         active_tests = [t for t in all_tests if not t.get("skip")]
 
         results = {
@@ -163,35 +190,36 @@ class TestRunner:
             "passed": 0,
             "failed": 0,
             "test_results": [],
+            "report": report,
         }
 
-        conversation_history: list[dict[str, str]] = []
+        # Last 10 user turns; the deque drops the oldest on append
+        conversation_history: deque[dict[str, str]] = deque(maxlen=10)
 
         for test in active_tests:
             test_name = test.get("name", "unnamed")
-            print(f"  Running: {test_name}...", end=" ", flush=True)
-
-            passes = 0
-            last_response = ""
-            last_error = ""
-            for _run in range(self.runs_per_test):
-                passed, response, error_msg = await self.run_test_case(test, conversation_history)
-                last_response = response
-                last_error = error_msg
-                if passed:
-                    passes += 1
+
+            # Stability runs are independent LLM round-trips on separate chats
+            runs = await asyncio.gather(*(
+                self.run_test_case(test, conversation_history, _run_chat_id(test_file.stem, run))
+                for run in range(self.runs_per_test)
+            ))
+            passes = sum(1 for passed, _, _ in runs if passed)
+            _, last_response, last_error = runs[-1]
 
             test_passed = passes >= max(1, self.runs_per_test // 2 + 1)
 
             if test_passed:
                 results["passed"] += 1
-                print("✓ PASS")
+                report.append(f"  Running: {test_name}... ✓ PASS")
             else:
                 results["failed"] += 1
-                print(f"✗ FAIL ({passes}/{self.runs_per_test} runs passed)")
-                print(f"    Response: {last_response[:120]!r}")
+                report.append(
+                    f"  Running: {test_name}... ✗ FAIL ({passes}/{self.runs_per_test} runs passed)"
+                )
+                report.append(f"    Response: {last_response[:120]!r}")
                 if last_error:
-                    print(f"    Errors:   {last_error}")
+                    report.append(f"    Errors:   {last_error}")
 
             results["test_results"].append({
                 "name": test_name,
@@ -207,7 +235,6 @@ class TestRunner:
                 user_text = test.get("user", "")
                 if user_text:
                     conversation_history.append({"role": "user", "content": user_text})
-                    conversation_history = conversation_history[-10:]
 
         return results
 
@@ -217,8 +244,7 @@ class TestRunner:
         Returns:
             Exit code (0 = success, 1 = failure)
         """
-        test_dir = Path(__file__).parent
-        test_files = sorted(test_dir.glob("test_*.yaml"))
+        test_files = sorted(_TEST_DIR.glob("test_*.yaml"))
 
         if not test_files:
             print("No test files found!")
@@ -226,23 +252,31 @@ class TestRunner:
 
         print(f"Running {len(test_files)} test suite(s)...\n")
 
-        all_results = []
-        total_tests = 0
-        total_passed = 0
-
-        for test_file in test_files:
-            print(f"Suite: {test_file.stem}")
-            results = await self.run_test_suite(test_file)
-            all_results.append(results)
-
-            total_tests += results["total_tests"]
-            total_passed += results["passed"]
-
-            print(f"  Passed: {results['passed']}/{results['total_tests']}\n")
-
-            # Reset session between suites
-            from app.storage.session_store import delete_session
-            await delete_session("telegram", "test_chat")
+        from app.storage.session_store import delete_sessions
+
+        sem = asyncio.Semaphore(_SUITE_CONCURRENCY)
+
+        async def _bounded(test_file: Path) -> dict[str, Any]:
+            async with sem:
+                results = await self.run_test_suite(test_file)
+            # One write per suite: the block stays contiguous next to other suites
+            lines = [
+                f"Suite: {test_file.stem}",
+                *results["report"],
+                f"  Passed: {results['passed']}/{results['total_tests']}\n",
+            ]
+            print("\n".join(lines), flush=True)
+            return results
+
+        all_results = await asyncio.gather(*map(_bounded, test_files))
+        # Every suite used its own chats, so all sessions go in one DELETE at the end
+        await delete_sessions("telegram", [
+            _run_chat_id(test_file.stem, run)
+            for test_file in test_files
+            for run in range(self.runs_per_test)
+        ])
+        total_tests = sum(r["total_tests"] for r in all_results)
+        total_passed = sum(r["passed"] for r in all_results)
 
         pass_rate = total_passed / total_tests if total_tests > 0 else 0.0
 
@@ -284,5 +318,4 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
+    sys.exit(run(main()))
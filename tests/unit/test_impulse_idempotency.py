@@ -0,0 +1,68 @@
+"""Tests for idempotent CRM writes in ImpulseAdapter (crm_cache "idem" entries).
+
+A crm_cache (Postgres) failure must never be treated as a CRM failure:
+that path enqueues a fallback replay and would double-book.
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.integrations.impulse.adapter import ImpulseAdapter
+from app.integrations.impulse.error_handler import ImpulseErrorHandler
+
+
+def _adapter(cache: MagicMock) -> ImpulseAdapter:
+    adapter = ImpulseAdapter.__new__(ImpulseAdapter)
+    adapter.client = MagicMock()
+    adapter.client.list = AsyncMock(return_value=[])
+    adapter.client.create = AsyncMock(return_value={"success": True, "count": 1})
+    adapter.cache = cache
+    adapter.error_handler = ImpulseErrorHandler()
+    adapter.fallback = MagicMock()
+    adapter.fallback.enqueue = AsyncMock()
+    return adapter
+
+
+def _broken_cache() -> MagicMock:
+    cache = MagicMock()
+    cache.get = AsyncMock(side_effect=ConnectionError("postgres down"))
+    cache.set = AsyncMock(side_effect=ConnectionError("postgres down"))
+    cache.clear_entity = AsyncMock(side_effect=ConnectionError("postgres down"))
+    return cache
+
+
+async def test_booking_succeeds_when_cache_is_down():
+    adapter = _adapter(_broken_cache())
+    reservation = await adapter.create_booking(
+        client_id=1, schedule_id=2, booking_date=datetime(2026, 10, 16, 19, 0), trace_id=uuid4()
+    )
+    assert reservation.client == {"id": 1}
+    adapter.client.create.assert_awaited_once()
+    adapter.fallback.enqueue.assert_not_awaited()
+
+
+async def test_cached_booking_skips_crm_write():
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value={"id": 7, "client": {"id": 1}, "schedule": {"id": 2}})
+    adapter = _adapter(cache)
+    reservation = await adapter.create_booking(client_id=1, schedule_id=2, trace_id=uuid4())
+    assert reservation.id == 7
+    adapter.client.create.assert_not_awaited()
+
+
+async def test_create_client_error_without_existing_id_raises():
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.set = AsyncMock()
+    adapter = _adapter(cache)
+    request = httpx.Request("POST", "https://crm.example/client/update")
+    adapter.client.create_tolerant = AsyncMock(
+        return_value=httpx.Response(422, text="validation failed", request=request)
+    )
+    with pytest.raises(RuntimeError):
+        await adapter.create_client("Анна", "+79990001122", trace_id=uuid4())
+    cache.set.assert_not_awaited()
@@ -354,3 +354,120 @@ class TestFormatForLlm:
     def test_service_ids_present(self):
         output = self.kb.format_for_llm()
         assert "high-heels" in output
+
+
+# ---------------------------------------------------------------------------
+# Schedule lookups (indexed accessors, get_next_class, format_schedule_text)
+# ---------------------------------------------------------------------------
+
+_SCHEDULE_DATA = [
+    {"service_id": "high-heels", "teacher_id": "katya", "day": "wednesday", "time": "19:00",
+     "duration_minutes": 60, "max_students": 12, "level": "начинающие", "room": "Зал 1"},
+    {"service_id": "high-heels", "teacher_id": "katya", "day": "Monday", "time": "18:00",
+     "duration_minutes": 60, "max_students": 12, "level": "продолжающие", "room": "Зал 2"},
+    {"service_id": "girly-hiphop", "teacher_id": "nobody", "day": "monday", "time": "10:00",
+     "duration_minutes": 60, "max_students": 12, "level": "все", "room": "Зал 1"},
+]
+
+
+class TestScheduleLookups:
+    def setup_method(self):
+        self.kb = _make_kb(schedule=_SCHEDULE_DATA)
+
+    def test_get_service_by_id(self):
+        assert self.kb.get_service_by_id("girly-hiphop").name == "Girly Hip-Hop"
+        assert self.kb.get_service_by_id("unknown") is None
+
+    def test_get_teacher_by_id(self):
+        assert self.kb.get_teacher_by_id("katya").name == "Катя"
+        assert self.kb.get_teacher_by_id("nobody") is None
+
+    def test_find_classes_by_style(self):
+        times = [e.time for e in self.kb.find_classes_by_style("high-heels")]
+        assert times == ["19:00", "18:00"]
+        assert self.kb.find_classes_by_style("vogue") == []
+
+    def test_find_classes_by_day_case_insensitive(self):
+        assert len(self.kb.find_classes_by_day("MONDAY")) == 2
+
+    def test_find_classes_by_teacher(self):
+        assert len(self.kb.find_classes_by_teacher("katya")) == 2
+
+    def test_returned_list_is_a_copy(self):
+        self.kb.find_classes_by_style("high-heels").clear()
+        assert len(self.kb.find_classes_by_style("high-heels")) == 2
+
+    def test_next_class_later_same_week(self):
+        from datetime import datetime
+
+        # 2026-10-12 is a Monday
+        nxt = self.kb.get_next_class("high-heels", datetime(2026, 10, 12, 18, 30))
+        assert (nxt.day, nxt.time) == ("wednesday", "19:00")
+
+    def test_next_class_later_same_day(self):
+        from datetime import datetime
+
+        nxt = self.kb.get_next_class("high-heels", datetime(2026, 10, 12, 17, 0))
+        assert nxt.time == "18:00"
+
+    def test_next_class_wraps_to_next_week(self):
+        from datetime import datetime
+
+        # Friday — nothing left this week → Monday class
+        nxt = self.kb.get_next_class("high-heels", datetime(2026, 10, 16, 12, 0))
+        assert nxt.time == "18:00"
+
+    def test_next_class_unknown_style(self):
+        assert self.kb.get_next_class("vogue") is None
+
+    def test_format_schedule_text(self):
+        text = self.kb.format_schedule_text()
+        assert text.index("Понедельник") < text.index("Среда")
+        assert "  10:00 - Girly Hip-Hop (все) - nobody - Зал 1" in text
+        assert text.index("10:00") < text.index("18:00")
+        assert "  18:00 - High Heels (продолжающие) - Катя - Зал 2" in text
+
+    def test_format_schedule_text_empty(self):
+        assert _make_kb().format_schedule_text() == "Расписание пока не заполнено."
+
+    def test_formatted_text_is_memoized(self):
+        assert self.kb.format_schedule_text() is self.kb.format_schedule_text()
+        assert self.kb.format_for_llm() is self.kb.format_for_llm()
+
+    def test_next_class_at_exact_start_time_skips_it(self):
+        from datetime import datetime
+
+        nxt = self.kb.get_next_class("high-heels", datetime(2026, 10, 12, 18, 0))
+        assert nxt.time == "19:00"
+
+    def test_next_class_wrap_picks_earliest_of_the_week(self):
+        from datetime import datetime
+
+        kb = _make_kb(schedule=[
+            {**_SCHEDULE_DATA[1], "time": "20:00"},
+            {**_SCHEDULE_DATA[1], "time": "09:00"},
+        ])
+        nxt = kb.get_next_class("high-heels", datetime(2026, 10, 18, 21, 0))  # Sunday night
+        assert nxt.time == "09:00"
+
+
+class TestSearchFaq:
+    def setup_method(self):
+        self.kb = _make_kb(faq=[
+            {"q": "Есть ли парковка у студии?", "a": "Да"},
+            {"q": "Парковка платная?", "a": "Нет"},
+            {"q": "Можно ли прийти без пары?", "a": "Да"},
+        ])
+
+    def test_case_insensitive_sorted_by_match_position(self):
+        assert [f.a for f in self.kb.search_faq("ПАРКОВКА")] == ["Нет", "Да"]
+
+    def test_no_match(self):
+        assert self.kb.search_faq("абонемент") == []
+
+
+class TestStudioTimezone:
+    def test_unknown_timezone_fails_validation(self):
+        data = {**_MINIMAL_KB_DATA, "studio": {**_MINIMAL_KB_DATA["studio"], "timezone": "Mars/Olympus"}}
+        with pytest.raises(Exception):
+            KnowledgeBase(**data)
@@ -0,0 +1,108 @@
+"""Unit tests for load_knowledge_base: YAML parsing and the JSON sidecar cache."""
+
+import os
+
+import pytest
+import yaml
+
+from app.knowledge import base
+from app.knowledge.base import reload_knowledge_base
+
+_KB_DATA = {
+    "schema_version": "1.0",
+    "studio": {"name": "She Dance", "schedule": "Через CRM", "address": "Тест, 1", "phone": "+7"},
+    "tone": {"style": "friendly", "pronouns": "ты"},
+    "services": [{"id": "high-heels", "name": "High Heels", "description": "Каблуки"}],
+    "teachers": [
+        {"id": "katya", "name": "Катя", "styles": ["High Heels"], "specialization": "Преподаватель"}
+    ],
+    "escalation": {"triggers": ["жалоба"]},
+}
+
+
+@pytest.fixture
+def kb_yaml(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = tmp_path / "studio.yaml"
+    path.write_text(yaml.safe_dump(_KB_DATA, allow_unicode=True), encoding="utf-8")
+    yield path
+    base._kb = None
+
+
+def _age(path, seconds: float) -> None:
+    st = path.stat()
+    os.utime(path, (st.st_atime - seconds, st.st_mtime - seconds))
+
+
+class TestJsonSidecar:
+    def test_sidecar_written_after_yaml_load(self, kb_yaml):
+        kb = reload_knowledge_base(str(kb_yaml))
+        assert kb.studio.name == "She Dance"
+        assert base._sidecar_path(kb_yaml).exists()
+        # Cache dir, not the source tree
+        assert not kb_yaml.with_suffix(".json").exists()
+
+    def test_fresh_sidecar_used_instead_of_yaml(self, kb_yaml):
+        reload_knowledge_base(str(kb_yaml))
+        sidecar = base._sidecar_path(kb_yaml)
+        sidecar.write_text(
+            sidecar.read_text(encoding="utf-8").replace("She Dance", "From Sidecar"),
+            encoding="utf-8",
+        )
+        # Touched but unchanged YAML: content hash still matches
+        _age(sidecar, 10)
+        kb = reload_knowledge_base(str(kb_yaml))
+        assert kb.studio.name == "From Sidecar"
+
+    def test_sidecar_kb_equals_yaml_kb(self, kb_yaml):
+        from_yaml = reload_knowledge_base(str(kb_yaml))
+        from_sidecar = reload_knowledge_base(str(kb_yaml))
+        assert from_sidecar == from_yaml
+        # Derived in StudioInfo.__init__ — must survive the sidecar round trip
+        assert from_sidecar.studio.address == "Тест, 1"
+
+    def test_sidecar_not_matching_schema_falls_back_to_yaml(self, kb_yaml):
+        sidecar = base._sidecar_path(kb_yaml)
+        sidecar.parent.mkdir(parents=True)
+        sidecar.write_text(
+            '{"format": %d, "schema": "%s", "source": "%s", "data": {"schema_version": "2.0"}}'
+            % (base._SIDECAR_FORMAT, base._schema_hash(), base._source_hash(kb_yaml.read_bytes())),
+            encoding="utf-8",
+        )
+        kb = reload_knowledge_base(str(kb_yaml))
+        assert kb.studio.name == "She Dance"
+
+    def test_stale_sidecar_ignored(self, kb_yaml):
+        reload_knowledge_base(str(kb_yaml))
+        _age(base._sidecar_path(kb_yaml), 10)
+        data = dict(_KB_DATA, studio=dict(_KB_DATA["studio"], name="New Name"))
+        kb_yaml.write_text(yaml.safe_dump(data, allow_unicode=True), encoding="utf-8")
+        kb = reload_knowledge_base(str(kb_yaml))
+        assert kb.studio.name == "New Name"
+
+    def test_changed_yaml_with_older_mtime_ignored(self, kb_yaml):
+        reload_knowledge_base(str(kb_yaml))
+        data = dict(_KB_DATA, studio=dict(_KB_DATA["studio"], name="New Name"))
+        kb_yaml.write_text(yaml.safe_dump(data, allow_unicode=True), encoding="utf-8")
+        # e.g. git checkout / rsync -t: new content, timestamp older than the sidecar
+        _age(kb_yaml, 10)
+        kb = reload_knowledge_base(str(kb_yaml))
+        assert kb.studio.name == "New Name"
+
+    def test_sidecar_with_other_format_ignored(self, kb_yaml):
+        sidecar = base._sidecar_path(kb_yaml)
+        sidecar.parent.mkdir(parents=True)
+        sidecar.write_text('{"format": -1, "data": {}}', encoding="utf-8")
+        kb = reload_knowledge_base(str(kb_yaml))
+        assert kb.studio.name == "She Dance"
+
+    def test_sidecar_from_other_model_schema_ignored(self, kb_yaml):
+        reload_knowledge_base(str(kb_yaml))
+        sidecar = base._sidecar_path(kb_yaml)
+        payload = sidecar.read_text(encoding="utf-8")
+        sidecar.write_text(
+            payload.replace(base._schema_hash(), "0" * 16).replace("She Dance", "Stale"),
+            encoding="utf-8",
+        )
+        kb = reload_knowledge_base(str(kb_yaml))
+        assert kb.studio.name == "She Dance"
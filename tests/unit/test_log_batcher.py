@@ -0,0 +1,106 @@
+"""Unit tests for LogBatcher (batched audit INSERTs)."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+from app.storage.log_batcher import LogBatcher
+from app.storage.postgres import PostgresStorage
+
+
+class _FakeConn:
+    def __init__(self, calls: list, fail: bool = False, bad: frozenset = frozenset()) -> None:
+        self.calls = calls
+        self.fail = fail
+        self.bad = bad
+
+    def is_closed(self) -> bool:
+        return False
+
+    async def executemany(self, sql, rows):
+        rows = list(rows)
+        if self.fail or self.bad.intersection(rows):
+            raise RuntimeError("db down")
+        self.calls.append(rows)
+
+    async def execute(self, sql, *row):
+        if self.fail or row in self.bad:
+            raise RuntimeError("bad row")
+        self.calls.append([row])
+
+
+class _FakePool:
+    def __init__(self, fail: bool = False, bad: frozenset = frozenset()) -> None:
+        self.calls: list[list[tuple]] = []
+        self.fail = fail
+        self.bad = bad
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield _FakeConn(self.calls, self.fail, self.bad)
+
+
+async def test_rows_within_delay_are_written_in_one_batch():
+    pool = _FakePool()
+    batcher = LogBatcher("messages", "INSERT", max_delay=0.05)
+    batcher.start(pool)
+    for i in range(5):
+        batcher.put((i,))
+    await asyncio.sleep(0.1)
+    assert pool.calls == [[(0,), (1,), (2,), (3,), (4,)]]
+    await batcher.close()
+
+
+async def test_max_batch_splits_flushes():
+    pool = _FakePool()
+    batcher = LogBatcher("messages", "INSERT", max_batch=2, max_delay=1.0)
+    batcher.start(pool)
+    for i in range(5):
+        batcher.put((i,))
+    await batcher.close()
+    assert [len(b) for b in pool.calls] == [2, 2, 1]
+
+
+async def test_close_flushes_pending_rows_and_stops():
+    pool = _FakePool()
+    batcher = LogBatcher("messages", "INSERT", max_delay=10.0)
+    batcher.start(pool)
+    batcher.put((1,))
+    batcher.put((2,))
+    await batcher.close()
+    assert pool.calls == [[(1,), (2,)]]
+    assert not batcher.running
+
+
+async def test_flush_errors_are_swallowed():
+    pool = _FakePool(fail=True)
+    batcher = LogBatcher("messages", "INSERT", max_delay=0.01)
+    batcher.start(pool)
+    batcher.put((1,))
+    await asyncio.sleep(0.05)
+    assert batcher.running
+    await batcher.close()
+
+
+async def test_failed_batch_is_retried_row_by_row():
+    pool = _FakePool(bad=frozenset({(2,)}))
+    batcher = LogBatcher("messages", "INSERT", max_delay=10.0)
+    batcher.start(pool)
+    for i in range(4):
+        batcher.put((i,))
+    await batcher.close()
+    assert pool.calls == [[(0,)], [(1,)], [(3,)]]
+
+
+async def test_jsonb_values_are_snapshotted_when_queued():
+    pool = _FakePool()
+    storage = PostgresStorage()
+    batcher = storage._batchers["llm_calls"]
+    batcher.start(pool)
+    messages = [{"role": "user", "content": "привет"}]
+    await storage.log_llm_call(uuid4(), "yandex", "gpt", request_json={"messages": messages})
+    messages.append({"role": "tool", "content": "later turn"})
+    await batcher.close()
+    row = pool.calls[0][0]
+    assert row[7] == '{"messages":[{"role":"user","content":"привет"}]}'
+    assert row[8] is None
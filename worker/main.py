@@ -39,6 +39,7 @@ from app.queue.outbound import (
     mark_retry,
     mark_sent,
 )
+from app.runtime import run
 from app.storage.postgres import postgres_storage
 
 logger = logging.getLogger(__name__)
@@ -217,14 +218,18 @@ async def _check_dlq_alert() -> None:
 _dlq_alerted: bool = False
 
 
-async def _run_poll_cycle(pool: asyncpg.Pool, sender: _TelegramSender) -> int:
+async def _run_poll_cycle(sender: _TelegramSender) -> int:
     """Claim a batch, send each message sequentially, return count processed.
 
     Sequential (not concurrent) within a batch to respect Telegram rate limits
     (30 msg/s). At BATCH_SIZE=10 and ~100ms per send we're at ~100 msg/s max,
     but real-world latency keeps us well under the limit.
+
+    The connection is released right after the claim: status updates after
+    each Telegram send go through the pool, so no DB connection is held
+    across HTTP calls and a dropped one cannot take the worker down with it.
     """
-    async with pool.acquire() as conn:
+    async with postgres_storage.worker_connection() as conn:
         batch = await _poll_batch(conn)
 
     if not batch:
@@ -242,7 +247,6 @@ async def _run_poll_cycle(pool: asyncpg.Pool, sender: _TelegramSender) -> int:
 # ---------------------------------------------------------------------------
 
 async def _worker_loop(
-    pool: asyncpg.Pool,
     sender: _TelegramSender,
     stop_event: asyncio.Event,
 ) -> None:
@@ -272,26 +276,33 @@ async def _worker_loop(
     await listen_conn.add_listener("outbound_new", _on_notify)
     logger.info("worker: LISTEN outbound_new — ready")
 
+    # Lets a shutdown signal cut the idle wait short instead of waiting out the poll interval
+    stop_wait = asyncio.ensure_future(stop_event.wait())
+
     try:
         while not stop_event.is_set():
-            processed = await _run_poll_cycle(pool, sender)
+            processed = await _run_poll_cycle(sender)
 
             if processed == BATCH_SIZE:
                 # Full batch returned — there may be more rows waiting.
                 # Skip the sleep and poll again immediately.
                 continue
 
-            # Wait for NOTIFY or the fallback timeout, whichever comes first.
-            try:
-                await asyncio.wait_for(
-                    notify_event.wait(),
-                    timeout=POLL_INTERVAL_SECONDS,
-                )
+            # Wait for NOTIFY, shutdown or the fallback timeout (periodic poll),
+            # whichever comes first.
+            notify_wait = asyncio.ensure_future(notify_event.wait())
+            await asyncio.wait(
+                (notify_wait, stop_wait),
+                timeout=POLL_INTERVAL_SECONDS,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if notify_wait.done():
                 notify_event.clear()
-            except asyncio.TimeoutError:
-                pass  # Normal — periodic poll
+            else:
+                notify_wait.cancel()
 
     finally:
+        stop_wait.cancel()
         await listen_conn.remove_listener("outbound_new", _on_notify)
         await listen_conn.close()
         logger.info("worker: LISTEN connection closed")
@@ -311,7 +322,7 @@ async def main() -> None:
 
     settings = get_settings()
 
-    # Connect to PostgreSQL (same pool settings as app: min=2, max=10).
+    # Connect to PostgreSQL (same pool settings as app: POSTGRES_POOL_MIN/MAX_SIZE).
     await postgres_storage.connect()
     pool: asyncpg.Pool = postgres_storage.pool  # type: ignore[assignment]
 
@@ -330,7 +341,7 @@ async def main() -> None:
         loop.add_signal_handler(sig, _handle_signal, sig)
 
     try:
-        await _worker_loop(pool, sender, stop_event)
+        await _worker_loop(sender, stop_event)
     finally:
         # On graceful shutdown: release any rows stuck in 'sending' back to
         # 'pending' so they are retried on the next worker start.
@@ -351,4 +362,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())